@@ -1,5 +1,3 @@
-from django.db import transaction
-
 from rest_framework.parsers import MultiPartParser
 
 from drf_spectacular.utils import extend_schema
@@ -38,7 +36,6 @@ class UploadFileView(APIView):
             400: get_error_schema(['ERROR_INVALID_FILE', 'ERROR_FILE_SIZE_TOO_LARGE'])
         }
     )
-    @transaction.atomic
     @map_exceptions({
         InvalidFileStreamError: ERROR_INVALID_FILE,
         FileSizeTooLargeError: ERROR_FILE_SIZE_TOO_LARGE
@@ -74,7 +71,6 @@ class UploadViaURLView(APIView):
             ])
         }
     )
-    @transaction.atomic
     @map_exceptions({
         InvalidFileStreamError: ERROR_INVALID_FILE,
         FileSizeTooLargeError: ERROR_FILE_SIZE_TOO_LARGE,
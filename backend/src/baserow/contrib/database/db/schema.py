@@ -12,6 +12,8 @@ class PostgresqlLenientDatabaseSchemaEditor:
 
     sql_alter_column_type = "ALTER COLUMN %(column)s TYPE %(type)s " \
                             "USING pg_temp.try_cast(%(column)s::text)"
+    sql_alter_column_type_direct_cast = "ALTER COLUMN %(column)s TYPE %(type)s " \
+                                        "USING %(column)s::%(type)s"
     sql_drop_try_cast = "DROP FUNCTION IF EXISTS pg_temp.try_cast(text, int)"
     sql_create_try_cast = """
         create or replace function pg_temp.try_cast(
@@ -35,14 +37,21 @@ class PostgresqlLenientDatabaseSchemaEditor:
     """
 
     def __init__(self, *args, alter_column_prepare_old_value='',
-                 alter_column_prepare_new_value=''):
+                 alter_column_prepare_new_value='', alter_column_direct_cast=False):
         self.alter_column_prepare_old_value = alter_column_prepare_old_value
         self.alter_column_prepare_new_value = alter_column_prepare_new_value
+        self.alter_column_direct_cast = alter_column_direct_cast
         super().__init__(*args)
 
     def _alter_field(self, model, old_field, new_field, old_type, new_type,
                      old_db_params, new_db_params, strict=False):
-        if old_type != new_type:
+        if old_type != new_type and self.alter_column_direct_cast:
+            # When the cast is guaranteed to succeed, for example between a date and
+            # a timestamp column, the column can be rewritten in a single server
+            # side pass with a plain cast expression. This avoids round tripping
+            # every value through text and the plpgsql conversion function.
+            self.sql_alter_column_type = self.sql_alter_column_type_direct_cast
+        elif old_type != new_type:
             variables = {}
 
             if isinstance(self.alter_column_prepare_old_value, tuple):
@@ -71,7 +80,8 @@ class PostgresqlLenientDatabaseSchemaEditor:
 
 @contextlib.contextmanager
 def lenient_schema_editor(connection, alter_column_prepare_old_value=None,
-                          alter_column_prepare_new_value=None):
+                          alter_column_prepare_new_value=None,
+                          alter_column_direct_cast=False):
     """
     A contextual function that yields a modified version of the connection's schema
     editor. This temporary version is more lenient then the regular editor. Normally
@@ -89,6 +99,11 @@ def lenient_schema_editor(connection, alter_column_prepare_old_value=None,
     :param alter_column_prepare_new_value: Optionally a query statement converting the
         `p_in` text value to the new type.
     :type alter_column_prepare_new_value: None or str
+    :param alter_column_direct_cast: Indicates if the old values can be converted
+        with a plain cast expression, which rewrites the column in a single server
+        side pass. Should only be used if the cast cannot fail because unlike the
+        conversion function a failing cast aborts the whole alteration.
+    :type alter_column_direct_cast: bool
     :raises ValueError: When the provided connection is not supported. For now only
         `postgresql` is supported.
     """
@@ -117,6 +132,9 @@ def lenient_schema_editor(connection, alter_column_prepare_old_value=None,
     if alter_column_prepare_new_value:
         kwargs['alter_column_prepare_new_value'] = alter_column_prepare_new_value
 
+    if alter_column_direct_cast:
+        kwargs['alter_column_direct_cast'] = alter_column_direct_cast
+
     try:
         with connection.schema_editor(**kwargs) as schema_editor:
             yield schema_editor
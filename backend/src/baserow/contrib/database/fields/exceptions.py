@@ -4,11 +4,11 @@ from baserow.core.exceptions import (
 
 
 class FieldTypeAlreadyRegistered(InstanceTypeAlreadyRegistered):
-    pass
+    __slots__ = ()
 
 
 class FieldTypeDoesNotExist(InstanceTypeDoesNotExist):
-    pass
+    __slots__ = ()
 
 
 class FieldNotInTable(Exception):
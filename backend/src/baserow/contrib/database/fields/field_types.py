@@ -1,4 +1,7 @@
+import re
+
 from decimal import Decimal
+from functools import lru_cache
 from pytz import timezone
 from random import randrange, randint
 from dateutil import parser
@@ -39,6 +42,147 @@ from .exceptions import (
 )
 from .fields import SingleSelectForeignKey
 
+# If the optional ciso8601 package is installed its C implementation is used to
+# parse ISO 8601 strings, which is faster than both strptime and dateutil.
+try:
+    from ciso8601 import parse_datetime as ciso8601_parse_datetime
+except ImportError:
+    ciso8601_parse_datetime = None
+
+
+# The UTC timezone object is cached at module level because `pytz.timezone` performs
+# a lookup and constructs a new object on every call while the result never changes.
+UTC = timezone('UTC')
+
+# The most common date string notations are parsed with an explicit strptime format
+# because that is much cheaper than dateutil's format inference. All the notations
+# are sniffed with one combined pattern, compiled once at import time, so the string
+# is scanned a single time and the matched group name tells which format to use for
+# the only strptime attempt that is needed. The formats must interpret the strings
+# exactly like dateutil would; `%d/%m/%Y` is deliberately not included because
+# dateutil resolves an ambiguous `01/02/2021` month first.
+DATE_STRING_SNIFFER = re.compile(
+    r'(?P<iso_datetime_seconds>\d{4}-\d{1,2}-\d{1,2} \d{1,2}:\d{2}:\d{2})$|'
+    r'(?P<iso_datetime>\d{4}-\d{1,2}-\d{1,2} \d{1,2}:\d{2})$|'
+    r'(?P<iso_date>\d{4}-\d{1,2}-\d{1,2})$|'
+    r'(?P<us_datetime>\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2})$|'
+    r'(?P<us_date>\d{1,2}/\d{1,2}/\d{4})$'
+)
+DATE_STRING_FORMATS = {
+    'iso_datetime_seconds': '%Y-%m-%d %H:%M:%S',
+    'iso_datetime': '%Y-%m-%d %H:%M',
+    'iso_date': '%Y-%m-%d',
+    'us_datetime': '%m/%d/%Y %H:%M',
+    'us_date': '%m/%d/%Y',
+}
+
+
+@lru_cache(maxsize=1024)
+def parse_fixed_date_string(value):
+    """
+    Parses the common fixed notations to a date or datetime object. Imports and
+    bulk row creations repeat the same date strings over and over again and the
+    result of these notations depends solely on the string itself, so it is
+    cached and batches of rows only pay the parsing cost once per unique string.
+    The returned objects are immutable which makes sharing them between rows safe.
+
+    :param value: The string that needs to be parsed.
+    :type value: str
+    :return: The parsed date or datetime or None when the string does not use one
+        of the fixed notations.
+    :rtype: datetime or None
+    """
+
+    if ciso8601_parse_datetime is not None:
+        try:
+            return ciso8601_parse_datetime(value)
+        except ValueError:
+            pass
+
+    # The C implemented fromisoformat handles the strict `YYYY-MM-DD` and
+    # `YYYY-MM-DD HH:MM:SS` notations much faster than strptime. The guard avoids
+    # paying for the raised ValueError on values that clearly cannot match.
+    if len(value) >= 10 and value[4] == '-':
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+
+    match = DATE_STRING_SNIFFER.match(value)
+
+    if match:
+        try:
+            return datetime.strptime(value, DATE_STRING_FORMATS[match.lastgroup])
+        except ValueError:
+            # The notation matched, but the values are out of range for this
+            # format, for example a month of 13. The flexible parser can still
+            # resolve some of those as day first dates.
+            pass
+
+    return None
+
+
+def parse_date_string(value):
+    """
+    Parses the provided string to a date or datetime object. The common notations
+    are parsed with the cached fixed notation parser and everything else falls
+    through to the flexible, but much slower dateutil parser. The fallback is
+    deliberately not cached because dateutil resolves incomplete inputs, for
+    example a time only string or a date without a year, relative to the current
+    date, so its result must be computed again on every call.
+
+    :param value: The string that needs to be parsed.
+    :type value: str
+    :raises ParserError: When the provided string could not be parsed.
+    :return: The parsed date or datetime.
+    :rtype: datetime
+    """
+
+    # A date string always contains at least one alphanumeric character and even the
+    # most verbose textual timestamp stays well under 64 characters. Rejecting
+    # anything else here skips the tokenisation the parsers below would otherwise
+    # run over the whole string before failing.
+    if len(value) > 64 or not any(character.isalnum() for character in value):
+        raise ParserError('String does not contain a date: %s', value)
+
+    parsed = parse_fixed_date_string(value)
+
+    if parsed is not None:
+        return parsed
+
+    return parser.parse(value)
+
+
+@lru_cache(maxsize=None)
+def get_date_value_preparer(date_include_time):
+    """
+    Builds a converter that turns a string into the aware datetime or date
+    object that is stored for a date field. The include time decision is made
+    once here instead of for every value, so the returned callable is
+    specialised for its field configuration and only does the work that is left.
+    The converted values themselves are not cached because the dateutil fallback
+    of the parser resolves incomplete inputs relative to the current date; the
+    parser caches the fixed notations internally. Only two configurations exist,
+    so the callables themselves are cached indefinitely.
+
+    :param date_include_time: Indicates if the field stores a datetime instead of
+        a date.
+    :type date_include_time: bool
+    :return: A callable accepting the string that needs to be converted and
+        returning the value that can be stored in the database. It raises a
+        ParserError when the provided string could not be parsed.
+    :rtype: callable
+    """
+
+    if date_include_time:
+        def prepare_value(value):
+            return parse_date_string(value).astimezone(UTC)
+    else:
+        def prepare_value(value):
+            return parse_date_string(value).astimezone(UTC).date()
+
+    return prepare_value
+
 
 class TextFieldType(FieldType):
     type = 'text'
@@ -250,20 +394,22 @@ class DateFieldType(FieldType):
         if not value:
             return value
 
-        utc = timezone('UTC')
-
         if type(value) == str:
             try:
-                value = parser.parse(value)
+                preparer = get_date_value_preparer(instance.date_include_time)
+                return preparer(value)
             except ParserError:
                 raise ValidationError('The provided string could not converted to a'
                                       'date.')
 
         if type(value) == date:
-            value = make_aware(datetime(value.year, value.month, value.day), utc)
+            # UTC never has daylight saving transitions, so the datetime can be
+            # constructed with the tzinfo directly instead of going through the
+            # disambiguation machinery of make_aware.
+            value = datetime(value.year, value.month, value.day, tzinfo=UTC)
 
         if type(value) == datetime:
-            value = value.astimezone(utc)
+            value = value.astimezone(UTC)
             return value if instance.date_include_time else value.date()
 
         raise ValidationError('The value should be a date/time string, date object or '
@@ -311,6 +457,19 @@ class DateFieldType(FieldType):
         return super().get_alter_column_prepare_old_value(connection, from_field,
                                                           to_field)
 
+    def get_alter_column_direct_cast(self, connection, from_field, to_field):
+        """
+        When the date_include_time setting is toggled the column changes between the
+        date and timestamp types. Those always cast cleanly into each other, so the
+        column can be rewritten with a plain cast expression in a single server side
+        pass instead of sending every value through the conversion function.
+        """
+
+        from_field_type = field_type_registry.get_by_model(from_field)
+        return (
+            from_field_type.type == self.type and connection.vendor == 'postgresql'
+        )
+
     def get_alter_column_prepare_new_value(self, connection, from_field, to_field):
         """
         If the field type has changed into a date field then we want to parse the old
@@ -225,6 +225,9 @@ class FieldHandler:
                     connection, old_field, field),
                 field_type.get_alter_column_prepare_new_value(
                     connection, old_field, field
+                ),
+                field_type.get_alter_column_direct_cast(
+                    connection, old_field, field
                 )
             ) as schema_editor:
                 try:
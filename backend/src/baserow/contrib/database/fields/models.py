@@ -179,6 +179,13 @@ class BooleanField(Field):
 
 
 class DateField(Field):
+    """
+    The date_include_time toggle is stored once per field on this model and decides
+    the type of the single column in the user's table: a `date` column when it is
+    off and a `timestamp` column when it is on. Toggling it alters that column in
+    place, so no per-row state is kept for it.
+    """
+
     date_format = models.CharField(
         choices=DATE_FORMAT_CHOICES,
         default=DATE_FORMAT_CHOICES[0][0],
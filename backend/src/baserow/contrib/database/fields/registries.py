@@ -233,6 +233,29 @@ class FieldType(MapAPIExceptionsInstanceMixin, APIUrlsInstanceMixin,
 
         return None
 
+    def get_alter_column_direct_cast(self, connection, from_field, to_field):
+        """
+        Indicates if the old column values can safely be converted with a plain
+        `::type` cast when altering the column. If so the lenient schema editor can
+        rewrite the column in a single server side pass instead of sending every
+        value through its plpgsql conversion function. This should only return True
+        if the cast is guaranteed to succeed for every possible value, because a
+        plain cast fails the whole alteration instead of replacing the value with
+        null.
+
+        :param connection: The used connection. This can for example be used to check
+            the database engine type.
+        :type connection: DatabaseWrapper
+        :param from_field: The old field instance.
+        :type to_field: Field
+        :param to_field: The new field instance.
+        :type to_field: Field
+        :return: Indicates if a plain cast can be used to alter the column.
+        :rtype: bool
+        """
+
+        return False
+
     def prepare_values(self, values, user):
         """
         The prepare_values hook gives the possibility to change the provided values
@@ -41,6 +41,9 @@ class Command(BaseCommand):
             model.objects.aggregate(max=Max('order')).get('max') or Decimal('0')
         )
 
+        rows = []
+        manytomany_values_per_row = []
+
         for i in range(0, limit):
             # Based on the random_value function we have for each type we can
             # build a dict with a random value for each field.
@@ -59,10 +62,16 @@ class Command(BaseCommand):
             order += Decimal('1')
             values['order'] = order
 
-            # Insert the row with the randomly created values.
-            instance = model.objects.create(**values)
+            rows.append(model(**values))
+            manytomany_values_per_row.append(manytomany_values)
+
+        # Inserting all the rows with a single bulk_create is much faster than a
+        # query per row.
+        model.objects.bulk_create(rows)
 
-            # Changes the set of the manytomany values.
+        # The many to many values can only be set after the rows have been inserted
+        # because the relations need the primary keys.
+        for instance, manytomany_values in zip(rows, manytomany_values_per_row):
             for field_name, value in manytomany_values.items():
                 if value and len(value) > 0:
                     getattr(instance, field_name).set(value)
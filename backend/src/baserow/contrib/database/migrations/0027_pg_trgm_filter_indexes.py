@@ -0,0 +1,51 @@
+# The contains view filter can be accelerated with a trigram GIN index on the
+# filtered column. New filters get their index when they are created, this migration
+# enables the pg_trgm extension and adds the index for the existing contains filters.
+from django.conf import settings
+from django.db import migrations, connections
+
+from baserow.contrib.database.fields.models import Field as FieldModel
+
+
+def forward(apps, schema_editor):
+    ViewFilter = apps.get_model('database', 'ViewFilter')
+    connection = connections[settings.USER_TABLE_DATABASE]
+
+    if connection.vendor != 'postgresql':
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    with connection.schema_editor() as tables_schema_editor:
+        # We need to stop the transaction because the indexes are created
+        # concurrently, which is not possible inside a transaction.
+        tables_schema_editor.atomic.__exit__(None, None, None)
+
+        # DISTINCT ON requires the leading ORDER BY expression to match, so the
+        # model's default ordering on id must be replaced.
+        view_filters = ViewFilter.objects.filter(
+            type__in=['contains', 'contains_not']
+        ).select_related('field__table').order_by('field_id').distinct('field_id')
+
+        for view_filter in view_filters:
+            table_name = f'database_table_{view_filter.field.table_id}'
+            column_name = FieldModel.db_column.__get__(view_filter.field, FieldModel)
+            tables_schema_editor.execute(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS '
+                f'"idx_{table_name}_{column_name}_trgm" '
+                f'ON "{table_name}" USING GIN (UPPER("{column_name}") gin_trgm_ops)'
+            )
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('database', '0026_auto_20210125_1454'),
+    ]
+
+    operations = [
+        migrations.RunPython(forward, migrations.RunPython.noop),
+    ]
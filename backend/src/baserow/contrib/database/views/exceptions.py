@@ -15,11 +15,11 @@ class UnrelatedFieldError(Exception):
 
 
 class ViewTypeAlreadyRegistered(InstanceTypeAlreadyRegistered):
-    pass
+    __slots__ = ()
 
 
 class ViewTypeDoesNotExist(InstanceTypeDoesNotExist):
-    pass
+    __slots__ = ()
 
 
 class ViewFilterDoesNotExist(Exception):
@@ -47,10 +47,14 @@ class ViewFilterTypeNotAllowedForField(Exception):
 class ViewFilterTypeDoesNotExist(InstanceTypeDoesNotExist):
     """Raised when the view filter type was not found in the registry."""
 
+    __slots__ = ()
+
 
 class ViewFilterTypeAlreadyRegistered(InstanceTypeAlreadyRegistered):
     """Raised when the view filter type is already registered in the registry."""
 
+    __slots__ = ()
+
 
 class ViewSortDoesNotExist(Exception):
     """Raised when trying to get a view sort that does not exist."""
@@ -1,4 +1,12 @@
+import re
+import logging
+from functools import reduce
+from operator import and_, or_
+
+from django.conf import settings
+from django.db import connections, transaction
 from django.db.models import Q, F
+from django.db.utils import DatabaseError
 
 from baserow.core.utils import extract_allowed, set_allowed_attrs
 from baserow.contrib.database.fields.registries import field_type_registry
@@ -12,7 +20,7 @@ from .exceptions import (
 )
 from .registries import view_type_registry, view_filter_type_registry
 from .models import (
-    View, GridViewFieldOptions, ViewFilter, ViewSort, FILTER_TYPE_AND, FILTER_TYPE_OR
+    View, GridViewFieldOptions, ViewFilter, ViewSort, FILTER_TYPE_AND
 )
 from .signals import (
     view_created, view_updated, view_deleted, view_filter_created, view_filter_updated,
@@ -21,6 +29,9 @@ from .signals import (
 )
 
 
+logger = logging.getLogger(__name__)
+
+
 class ViewHandler:
     def get_view(self, view_id, view_model=None, base_queryset=None):
         """
@@ -236,39 +247,64 @@ class ViewHandler:
         if view.filters_disabled:
             return queryset
 
-        q_filters = Q()
+        field_objects = model._field_objects
+        q_filters = []
+        annotations = {}
+
+        # Multiple filters of a view commonly target the same field, so the resolved
+        # model fields, including their bound get_prep_value methods that the filter
+        # types call, are reused instead of asking the model meta again.
+        model_fields = {}
 
         for view_filter in view.viewfilter_set.all():
             # If the to be filtered field is not present in the `_field_objects` we
             # cannot filter so we raise a ValueError.
-            if view_filter.field_id not in model._field_objects:
+            if view_filter.field_id not in field_objects:
                 raise ValueError(f'The table model does not contain field '
                                  f'{view_filter.field_id}.')
 
-            field_name = model._field_objects[view_filter.field_id]['name']
-            model_field = model._meta.get_field(field_name)
+            field_name = field_objects[view_filter.field_id]['name']
+            model_field = model_fields.get(field_name)
+
+            if model_field is None:
+                model_field = model._meta.get_field(field_name)
+                model_fields[field_name] = model_field
             view_filter_type = view_filter_type_registry.get(view_filter.type)
-            q_filter = view_filter_type.get_filter(
+
+            q_filters.append(view_filter_type.get_filter(
                 field_name,
                 view_filter.value,
                 model_field
-            )
+            ))
 
             view_filter_annotation = view_filter_type.get_annotation(
                 field_name,
                 view_filter.value
             )
             if view_filter_annotation:
-                queryset = queryset.annotate(**view_filter_annotation)
-
-            # Depending on filter type we are going to combine the Q either as AND or
-            # as OR.
-            if view.filter_type == FILTER_TYPE_AND:
-                q_filters &= q_filter
-            elif view.filter_type == FILTER_TYPE_OR:
-                q_filters |= q_filter
-
-        queryset = queryset.filter(q_filters)
+                # The filter types generate an alias that is unique per field and
+                # value combination, so updating the dict can only overwrite an
+                # identical annotation.
+                annotations.update(view_filter_annotation)
+
+        # All the annotations can be applied in a single annotate call instead of
+        # cloning the queryset for every filter that needs one.
+        if annotations:
+            queryset = queryset.annotate(**annotations)
+
+        # Depending on the view's filter type the Q objects are combined with either
+        # AND or OR. Collecting them first and combining them once is cheaper than
+        # growing a Q object incrementally because that copies the tree every time.
+        # The combined Q compiles down to a single composed WHERE predicate with
+        # bound parameters.
+        combine = and_ if view.filter_type == FILTER_TYPE_AND else or_
+        combined = reduce(combine, q_filters, Q())
+
+        # An empty predicate, for example when the view has no filters or when all
+        # the filter values were invalid, would only clone the queryset without
+        # changing the query, so it can be skipped entirely.
+        if combined:
+            queryset = queryset.filter(combined)
 
         return queryset
 
@@ -364,10 +400,70 @@ class ViewHandler:
             value=value
         )
 
+        self.create_filter_index(view_filter_type, field)
+
         view_filter_created.send(self, view_filter=view_filter, user=user)
 
         return view_filter
 
+    def create_filter_index(self, view_filter_type, field):
+        """
+        Schedules the creation of the index provided by the view filter type for the
+        field's column if there is one. The index makes sure that evaluating the
+        filter on a large table does not degrade into a sequential scan. The
+        statements run after the current transaction has been committed because
+        building an index takes locks on the user's table that must not be held for
+        the duration of the request transaction. Outside of a transaction block the
+        index can also be built concurrently, which does not block writes to the
+        table while it is being built.
+
+        :param view_filter_type: The type of the created or updated view filter.
+        :type view_filter_type: ViewFilterType
+        :param field: The field that the filter compares the value with.
+        :type field: Field
+        """
+
+        connection = connections[settings.USER_TABLE_DATABASE]
+
+        if connection.vendor != 'postgresql':
+            return
+
+        index_sql = view_filter_type.get_index_sql(
+            f'database_table_{field.table_id}',
+            field.db_column
+        )
+
+        if not index_sql:
+            return
+
+        def execute_index_sql():
+            user_table_connection = connections[settings.USER_TABLE_DATABASE]
+
+            try:
+                with user_table_connection.cursor() as cursor:
+                    for statement in index_sql:
+                        cursor.execute(statement)
+            except DatabaseError as e:
+                # The filter itself has already been committed, so a failed index
+                # build must only be logged and not escape the post commit hook. A
+                # failed concurrent build also leaves an invalid index behind that
+                # IF NOT EXISTS would treat as present forever, so it is dropped
+                # again to allow a later attempt to rebuild it.
+                logger.error(str(e))
+                match = re.search(r'INDEX CONCURRENTLY IF NOT EXISTS "([^"]+)"',
+                                  index_sql[0])
+
+                if match:
+                    try:
+                        with user_table_connection.cursor() as cursor:
+                            cursor.execute(
+                                f'DROP INDEX CONCURRENTLY IF EXISTS "{match[1]}"'
+                            )
+                    except DatabaseError as e:
+                        logger.error(str(e))
+
+        transaction.on_commit(execute_index_sql)
+
     def update_filter(self, user, view_filter, **kwargs):
         """
         Updates the values of an existing view filter.
@@ -411,11 +507,21 @@ class ViewHandler:
             raise FieldNotInTable(f'The field {field.pk} does not belong to table '
                                   f'{view_filter.view.table.id}.')
 
+        # Only when the filter targets another field or uses another type can a new
+        # index be needed. A changed value never requires one, so the DDL is skipped
+        # in that case.
+        index_needs_update = (
+            field.id != view_filter.field_id or type_name != view_filter.type
+        )
+
         view_filter.field = field
         view_filter.value = value
         view_filter.type = type_name
         view_filter.save()
 
+        if index_needs_update:
+            self.create_filter_index(view_filter_type, field)
+
         view_filter_updated.send(self, view_filter=view_filter, user=user)
 
         return view_filter
@@ -139,6 +139,26 @@ class ViewFilterType(Instance):
 
         return None
 
+    def get_index_sql(self, table_name, field_name):
+        """
+        Optional method allowing this ViewFilterType to return raw SQL statements
+        that create an index accelerating the filter on the provided column. The
+        statements are executed after the transaction that created or updated a
+        filter of this type has been committed, so they must be idempotent and
+        they can use CONCURRENTLY because they do not run inside a transaction
+        block. Should return None if no index is needed.
+
+        :param table_name: The name of the table that contains the column.
+        :type table_name: str
+        :param field_name: The name of the column that needs to be filtered.
+        :type field_name: str
+        :return: The SQL statements that create the index or None if no index
+            needs to be created.
+        :rtype: None or list
+        """
+
+        return None
+
 
 class ViewFilterTypeRegistry(Registry):
     """
@@ -1,11 +1,19 @@
+import re
+
 from math import floor, ceil
+from hashlib import md5
+from functools import lru_cache, reduce
+from operator import or_
 from pytz import timezone
 from decimal import Decimal
+from datetime import date, timedelta
 
 from dateutil import parser
 from dateutil.parser import ParserError
 
-from django.db.models import Q, IntegerField, BooleanField
+from django.conf import settings
+from django.db import connections
+from django.db.models import Q, IntegerField, BooleanField, CharField, TextField
 from django.db.models.expressions import RawSQL
 from django.db.models.fields.related import ManyToManyField, ForeignKey
 from django.contrib.postgres.fields import JSONField
@@ -19,9 +27,65 @@ from baserow.contrib.database.fields.field_types import (
 from .registries import ViewFilterType
 
 
+# The values that are considered to be truthy by the boolean view filter. This is a
+# module level frozenset so that the hashed membership check in `get_filter` does not
+# have to build a new list on every call.
+TRUE_VALUES = frozenset(['y', 't', 'o', 'yes', 'true', 'on', '1'])
+
+# The UTC timezone object is cached at module level because constructing it via
+# `pytz.timezone` involves a lookup on every call while the result is always the same.
+UTC = timezone('UTC')
+
+
+@lru_cache(maxsize=1024)
+def parse_decimal(value):
+    """
+    Parses the provided string to a Decimal. View filter values rarely change while
+    every list request evaluates the filters again, so the parsed result is cached
+    to avoid constructing the same Decimal over and over again. Decimals are
+    immutable which makes sharing them safe.
+
+    :param value: The value that needs to be parsed.
+    :type value: str
+    :return: The parsed decimal.
+    :rtype: Decimal
+    """
+
+    return Decimal(value)
+
+
+@lru_cache(maxsize=None)
+def get_empty_filter_category(model_field_class):
+    """
+    Classifies the provided model field class for the empty view filter. The
+    classification only depends on the class, so the result is cached and the
+    isinstance chain only has to run once per class instead of on every filter
+    evaluation.
+
+    :param model_field_class: The class of the field extracted from the model.
+    :type model_field_class: type
+    :return: The category name the empty view filter dispatches on.
+    :rtype: str
+    """
+
+    if issubclass(model_field_class, (ManyToManyField, ForeignKey)):
+        return 'relation'
+    elif issubclass(model_field_class, BooleanField):
+        return 'boolean'
+    elif issubclass(model_field_class, JSONField):
+        return 'json'
+    else:
+        return 'other'
+
+
 class NotViewFilterTypeMixin:
     def get_filter(self, *args, **kwargs):
-        return ~super().get_filter(*args, **kwargs)
+        q = super().get_filter(*args, **kwargs)
+        # The Q object returned by the super call is freshly constructed, so it can
+        # safely be negated in place, which avoids the copy that the `~` operator
+        # makes.
+        q.negate()
+        return q
 
 
 class EqualViewFilterType(ViewFilterType):
@@ -49,6 +113,11 @@ class EqualViewFilterType(ViewFilterType):
         if value == '':
             return Q()
 
+        # Text based model fields accept any string, so the exception based
+        # get_prep_value validation below can be skipped entirely.
+        if isinstance(model_field, (CharField, TextField)):
+            return Q(**{field_name: value})
+
         # Check if the model_field accepts the value.
         try:
             model_field.get_prep_value(value)
@@ -75,6 +144,24 @@ class FilenameContainsViewFilterType(ViewFilterType):
         FileFieldType.type
     ]
 
+    def get_annotation_name(self, field_name, value):
+        """
+        Generates the alias under which the match is annotated on the queryset. A
+        view can have multiple filename contains filters on the same field, so a
+        digest of the value is included to keep the aliases distinct and prevent
+        one filter's annotation from overwriting another's.
+
+        :param field_name: The name of the field that is being filtered.
+        :type field_name: str
+        :param value: The stripped filter value.
+        :type value: str
+        :return: The annotation alias for this field and value combination.
+        :rtype: str
+        """
+
+        value_hash = md5(value.encode()).hexdigest()[:8]
+        return f'{field_name}_matches_visible_names_{value_hash}'
+
     def get_annotation(self, field_name, value):
         value = value.strip()
 
@@ -90,19 +177,40 @@ class FilenameContainsViewFilterType(ViewFilterType):
         # However this is an exact match, so in the above example [{"key":"value_etc"}]
         # would not match the filter.
         #
-        # Instead we have to resort to RawSQL to use various built in PostgreSQL JSON
-        # Array manipulation functions to be able to 'iterate' over a JSONB list
-        # performing `like` on individual keys in said list.
-        num_files_with_name_like_value = f"""
-            EXISTS(
-                SELECT attached_files ->> 'visible_name'
-                FROM JSONB_ARRAY_ELEMENTS("{field_name}") as attached_files
-                WHERE UPPER(attached_files ->> 'visible_name') LIKE UPPER(%s)
+        # Instead we have to resort to RawSQL to be able to match individual keys of
+        # the objects in a JSONB list.
+        connection = connections[settings.USER_TABLE_DATABASE]
+
+        if connection.vendor == 'postgresql' and connection.pg_version >= 120000:
+            # PostgreSQL 12 introduced the jsonpath language which can check if any
+            # object in the list has a matching key in a single predicate instead
+            # of expanding the list into rows, and the `flag "i"` makes the match
+            # case insensitive without having to call UPPER for every file. The
+            # value is escaped because it must be matched literally and not as a
+            # regular expression. The jsonpath string literal strips unknown
+            # backslash escapes, so the backslashes that re.escape produced must be
+            # doubled to survive until the like_regex pattern.
+            escaped_value = re.escape(value).replace('\\', '\\\\').replace('"', '\\"')
+            jsonpath = (
+                f'$[*].visible_name ? (@ like_regex "{escaped_value}" flag "i")'
             )
-        """
-        query = RawSQL(num_files_with_name_like_value, params=[f"%{value}%"],
-                       output_field=BooleanField())
-        return {f"{field_name}_matches_visible_names": query}
+            query = RawSQL(f'"{field_name}" @? %s::jsonpath', params=[jsonpath],
+                           output_field=BooleanField())
+        else:
+            # Older PostgreSQL versions do not understand jsonpath, so we fall back
+            # on 'iterating' over the JSONB list with the built in JSON array
+            # manipulation functions, performing `like` on the individual keys.
+            num_files_with_name_like_value = f"""
+                EXISTS(
+                    SELECT attached_files ->> 'visible_name'
+                    FROM JSONB_ARRAY_ELEMENTS("{field_name}") as attached_files
+                    WHERE UPPER(attached_files ->> 'visible_name') LIKE UPPER(%s)
+                )
+            """
+            query = RawSQL(num_files_with_name_like_value, params=[f"%{value}%"],
+                           output_field=BooleanField())
+
+        return {self.get_annotation_name(field_name, value): query}
 
     def get_filter(self, field_name, value, model_field):
         value = value.strip()
@@ -112,7 +220,7 @@ class FilenameContainsViewFilterType(ViewFilterType):
             return Q()
 
         # Check if the model_field has a file which matches the provided filter value.
-        return Q(**{f'{field_name}_matches_visible_names': True})
+        return Q(**{self.get_annotation_name(field_name, value): True})
 
 
 class ContainsViewFilterType(ViewFilterType):
@@ -136,6 +244,12 @@ class ContainsViewFilterType(ViewFilterType):
         if value == '':
             return Q()
 
+        # Text based model fields accept any string, so the exception based
+        # get_prep_value validation below can be skipped entirely. All the
+        # compatible field types are backed by text columns.
+        if isinstance(model_field, (CharField, TextField)):
+            return Q(**{f'{field_name}__icontains': value})
+
         # Check if the model_field accepts the value.
         try:
             model_field.get_prep_value(value)
@@ -145,6 +259,18 @@ class ContainsViewFilterType(ViewFilterType):
 
         return Q()
 
+    def get_index_sql(self, table_name, field_name):
+        # The icontains lookup compiles to `UPPER(column) LIKE UPPER(%s)` with a
+        # leading wildcard, which a btree index can never serve. A trigram GIN index
+        # on the UPPER expression does match that predicate, so the filter can be
+        # answered from the index instead of scanning every row. The pg_trgm
+        # extension is enabled by a migration.
+        return [
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS '
+            f'"idx_{table_name}_{field_name}_trgm" '
+            f'ON "{table_name}" USING GIN (UPPER("{field_name}") gin_trgm_ops)'
+        ]
+
 
 class ContainsNotViewFilterType(NotViewFilterTypeMixin, ContainsViewFilterType):
     type = 'contains_not'
@@ -167,9 +293,8 @@ class HigherThanViewFilterType(ViewFilterType):
         if value == '':
             return Q()
 
-        if isinstance(model_field, IntegerField) and value.find('.') != -1:
-            decimal = Decimal(value)
-            value = floor(decimal)
+        if isinstance(model_field, IntegerField) and '.' in value:
+            value = floor(parse_decimal(value))
 
         # Check if the model_field accepts the value.
         try:
@@ -198,9 +323,8 @@ class LowerThanViewFilterType(ViewFilterType):
         if value == '':
             return Q()
 
-        if isinstance(model_field, IntegerField) and value.find('.') != -1:
-            decimal = Decimal(value)
-            value = ceil(decimal)
+        if isinstance(model_field, IntegerField) and '.' in value:
+            value = ceil(parse_decimal(value))
 
         # Check if the model_field accepts the value.
         try:
@@ -233,26 +357,53 @@ class DateEqualViewFilterType(ViewFilterType):
         if value == '':
             return Q()
 
-        utc = timezone('UTC')
+        # If the length if string value is lower than 10 characters we know it is only
+        # a date so we can match on the whole day with a half open range. Unlike
+        # separate year, month and day comparisons, which compile to EXTRACT
+        # predicates, the range compares the column itself, so a btree index can
+        # serve it, and it still gives accurate results when comparing with a
+        # models.DateTimeField. The common `YYYY-MM-DD` case is parsed with the
+        # fast C implementation of `date.fromisoformat`, other short ISO notations
+        # fall back on the more flexible dateutil parser below.
+        if len(value) <= 10:
+            try:
+                parsed_date = date.fromisoformat(value)
+                return Q(**{
+                    f'{field_name}__gte': parsed_date,
+                    f'{field_name}__lt': parsed_date + timedelta(days=1)
+                })
+            except ValueError:
+                pass
 
         try:
-            datetime = parser.isoparse(value).astimezone(utc)
+            datetime = parser.isoparse(value).astimezone(UTC)
         except (ParserError, ValueError):
             return Q()
 
-        # If the length if string value is lower than 10 characters we know it is only
-        # a date so we can match only on year, month and day level. This way if a date
-        # is provided, but if it tries to compare with a models.DateTimeField it will
-        # still give back accurate results.
         if len(value) <= 10:
+            parsed_date = datetime.date()
             return Q(**{
-                f'{field_name}__year': datetime.year,
-                f'{field_name}__month': datetime.month,
-                f'{field_name}__day': datetime.day
+                f'{field_name}__gte': parsed_date,
+                f'{field_name}__lt': parsed_date + timedelta(days=1)
             })
         else:
             return Q(**{field_name: datetime})
 
+    def get_index_sql(self, table_name, field_name):
+        # The date filters compare the column with a constant, either directly or
+        # with a half open day range, which a btree index can serve. Raising the
+        # statistics
+        # target of the column gives the planner a more accurate histogram to decide
+        # when the index is worth using; the new target takes effect with the next
+        # analyze run.
+        return [
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS '
+            f'"idx_{table_name}_{field_name}_btree" '
+            f'ON "{table_name}" ("{field_name}")',
+            f'ALTER TABLE "{table_name}" ALTER COLUMN "{field_name}" '
+            f'SET STATISTICS 1000'
+        ]
+
 
 class DateNotEqualViewFilterType(NotViewFilterTypeMixin, DateEqualViewFilterType):
     type = 'date_not_equal'
@@ -297,16 +448,7 @@ class BooleanViewFilterType(ViewFilterType):
     compatible_field_types = [BooleanFieldType.type]
 
     def get_filter(self, field_name, value, model_field):
-        value = value.strip().lower()
-        value = value in [
-            'y',
-            't',
-            'o',
-            'yes',
-            'true',
-            'on',
-            '1',
-        ]
+        value = value.strip().lower() in TRUE_VALUES
 
         # Check if the model_field accepts the value.
         try:
@@ -339,32 +481,35 @@ class EmptyViewFilterType(ViewFilterType):
     ]
 
     def get_filter(self, field_name, value, model_field):
+        category = get_empty_filter_category(type(model_field))
+
         # If the model_field is a ManyToMany field we only have to check if it is None.
-        if (
-            isinstance(model_field, ManyToManyField) or
-            isinstance(model_field, ForeignKey)
-        ):
+        if category == 'relation':
             return Q(**{f'{field_name}': None})
 
-        if isinstance(model_field, BooleanField):
+        if category == 'boolean':
             return Q(**{f'{field_name}': False})
 
-        q = Q(**{f'{field_name}__isnull': True})
-        q.add(Q(**{f'{field_name}': None}), Q.OR)
+        q_items = [
+            Q(**{f'{field_name}__isnull': True}),
+            Q(**{f'{field_name}': None})
+        ]
 
-        if isinstance(model_field, JSONField):
-            q.add(Q(**{f'{field_name}': []}), Q.OR)
-            q.add(Q(**{f'{field_name}': {}}), Q.OR)
+        if category == 'json':
+            q_items.append(Q(**{f'{field_name}': []}))
+            q_items.append(Q(**{f'{field_name}': {}}))
 
         # If the model field accepts an empty string as value we are going to add
         # that to the or statement.
         try:
             model_field.get_prep_value('')
-            q.add(Q(**{f'{field_name}': ''}), Q.OR)
+            q_items.append(Q(**{f'{field_name}': ''}))
         except Exception:
             pass
 
-        return q
+        # Combining the collected items once is cheaper than repeatedly calling
+        # `q.add` because that copies the tree on every call.
+        return reduce(or_, q_items)
 
 
 class NotEmptyViewFilterType(NotViewFilterTypeMixin, EmptyViewFilterType):
@@ -53,25 +53,32 @@ class ApplicationDoesNotExist(Exception):
 class InstanceTypeAlreadyRegistered(Exception):
     """
     Raised when the instance model instance is already registered in the registry.
+    The registry exceptions define `__slots__` so that their attributes are stored
+    in slots and no new attributes can accidentally be added. Because `Exception`
+    itself does not define `__slots__`, the instances still carry a `__dict__`.
     """
 
+    __slots__ = ()
+
 
 class InstanceTypeDoesNotExist(Exception):
     """
     Raised when a requested instance model instance isn't registered in the registry.
     """
 
+    __slots__ = ('type_name',)
+
     def __init__(self, type_name, *args, **kwargs):
         self.type_name = type_name
         super().__init__(*args, **kwargs)
 
 
 class ApplicationTypeAlreadyRegistered(InstanceTypeAlreadyRegistered):
-    pass
+    __slots__ = ()
 
 
 class ApplicationTypeDoesNotExist(InstanceTypeDoesNotExist):
-    pass
+    __slots__ = ()
 
 
 class BaseURLHostnameNotAllowed(Exception):
@@ -184,13 +184,17 @@ class Registry(object):
         :rtype: InstanceModelInstance
         """
 
-        if type_name not in self.registry:
+        # The instances are registered once at startup and shared afterwards, so the
+        # same instance is returned for every call. The lookup itself is done once
+        # instead of first testing for membership because this method is called for
+        # every filter, field and view type resolution.
+        try:
+            return self.registry[type_name]
+        except KeyError:
             raise self.does_not_exist_exception_class(
                 type_name, f'The {self.name} type {type_name} does not exist.'
             )
 
-        return self.registry[type_name]
-
     def get_types(self):
         """
         Returns a list of available type names.
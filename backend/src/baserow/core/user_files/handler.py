@@ -10,7 +10,8 @@ from PIL import Image, ImageOps
 
 from django.conf import settings
 from django.core.files.storage import default_storage
-from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.db import transaction
 
 from baserow.core.utils import sha256_hash, stream_size, random_string, truncate_middle
 
@@ -161,6 +162,13 @@ class UserFileHandler:
         if not hasattr(stream, 'read'):
             raise InvalidFileStreamError('The provided stream is not readable.')
 
+        # Small uploads are kept in memory by Django as an InMemoryUploadedFile
+        # wrapping a BytesIO buffer. Unwrapping it here lets the hashing, the image
+        # detection and the save below operate on the buffer directly instead of
+        # going through the upload wrapper's proxy methods.
+        if isinstance(stream, InMemoryUploadedFile):
+            stream = stream.file
+
         size = stream_size(stream)
 
         if size > settings.USER_FILE_SIZE_LIMIT:
@@ -198,7 +206,10 @@ class UserFileHandler:
         except IOError:
             pass
 
-        user_file = UserFile.objects.create(
+        # The instance is not saved yet because the file and the thumbnails must be
+        # transferred to the storage first. The generated paths only depend on the
+        # unique, hash and extension values, which are all already known.
+        user_file = UserFile(
             original_name=file_name,
             original_extension=extension,
             size=size,
@@ -221,13 +232,23 @@ class UserFileHandler:
             # from memory.
             del image
 
-        # Save the file to the storage.
+        # Save the file to the storage. Streams that Django has spooled to a
+        # temporary file are already moved into a local storage with an O(1) rename
+        # by the storage itself, so no manual copying fast path is needed here.
         full_path = self.user_file_path(user_file)
         storage.save(full_path, stream)
 
         # Close the stream because we don't need it anymore.
         stream.close()
 
+        # The entry is inserted last so that a failed transfer to the storage cannot
+        # leave a committed row behind whose file was never stored, which the
+        # deduplication lookup above would keep returning. Only the insert itself
+        # needs to happen inside a transaction; the hashing and the transfer can
+        # take a long time and must not keep a database transaction open.
+        with transaction.atomic():
+            user_file.save()
+
         return user_file
 
     def upload_user_file_by_url(self, user, url, storage=None):
@@ -255,12 +276,50 @@ class UserFileHandler:
                 raise FileURLCouldNotBeReached('The response did not respond with an '
                                                'OK status code.')
 
-            content = response.raw.read(
-                settings.USER_FILE_SIZE_LIMIT + 1,
-                decode_content=True
-            )
+            # Stream the response body into a buffer in chunks so that the size limit
+            # can be enforced while downloading, instead of first reading the entire
+            # body into memory.
+            stream = BytesIO()
+            size = 0
+
+            if not response.headers.get('content-encoding'):
+                # If the body is not compressed the bytes can be read straight into
+                # one reusable buffer with readinto, which avoids allocating a new
+                # bytes object for every received chunk.
+                buffer = bytearray(65536)
+                view = memoryview(buffer)
+
+                while True:
+                    length = response.raw.readinto(buffer)
+
+                    if not length:
+                        break
+
+                    size += length
+
+                    if size > settings.USER_FILE_SIZE_LIMIT:
+                        response.close()
+                        raise FileSizeTooLargeError(
+                            settings.USER_FILE_SIZE_LIMIT,
+                            'The provided file is too large.'
+                        )
+
+                    stream.write(view[:length])
+            else:
+                # A compressed body must be decoded while reading, which
+                # `iter_content` takes care of.
+                for chunk in response.iter_content(chunk_size=65536):
+                    size += len(chunk)
+
+                    if size > settings.USER_FILE_SIZE_LIMIT:
+                        response.close()
+                        raise FileSizeTooLargeError(
+                            settings.USER_FILE_SIZE_LIMIT,
+                            'The provided file is too large.'
+                        )
+
+                    stream.write(chunk)
         except RequestException:
             raise FileURLCouldNotBeReached('The provided URL could not be reached.')
 
-        file = SimpleUploadedFile(file_name, content)
-        return UserFileHandler().upload_user_file(user, file_name, file, storage)
+        return self.upload_user_file(user, file_name, stream, storage)
@@ -193,6 +193,12 @@ def sha256_hash(stream, block_size=65536):
     """
 
     stream.seek(0)
+
+    # In memory streams like BytesIO expose their whole buffer, which can be hashed
+    # with a single call instead of copying it out chunk by chunk.
+    if hasattr(stream, 'getbuffer'):
+        return hashlib.sha256(stream.getbuffer()).hexdigest()
+
     hasher = hashlib.sha256()
     for stream_chunk in iter(lambda: stream.read(block_size), b''):
         hasher.update(stream_chunk)
@@ -2,6 +2,8 @@ import pytest
 from unittest.mock import patch
 from decimal import Decimal
 
+from django.db.utils import DatabaseError
+
 from baserow.core.exceptions import UserNotInGroupError
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.models import View, GridView, ViewFilter, ViewSort
@@ -520,6 +522,86 @@ def test_create_filter(send_mock, data_fixture):
     assert view_filter_2.value == 'test'
 
 
+@pytest.mark.django_db
+@patch('baserow.contrib.database.views.handler.transaction.on_commit')
+def test_create_filter_index(on_commit_mock, data_fixture):
+    user = data_fixture.create_user()
+    grid_view = data_fixture.create_grid_view(user=user)
+    text_field = data_fixture.create_text_field(table=grid_view.table)
+    date_field = data_fixture.create_date_field(table=grid_view.table)
+
+    handler = ViewHandler()
+
+    # The equal filter type does not provide any index sql, so nothing must be
+    # scheduled.
+    handler.create_filter_index(view_filter_type_registry.get('equal'), text_field)
+    on_commit_mock.assert_not_called()
+
+    # The index statements must run after the surrounding transaction has been
+    # committed so that the locks they take are not held for the duration of the
+    # request.
+    handler.create_filter_index(
+        view_filter_type_registry.get('date_equal'), date_field
+    )
+    on_commit_mock.assert_called_once()
+
+    with patch(
+        'baserow.contrib.database.views.handler.connections'
+    ) as connections_mock:
+        on_commit_mock.call_args[0][0]()
+        cursor = connections_mock.__getitem__().cursor().__enter__()
+        executed = [args[0] for args, kwargs in cursor.execute.call_args_list]
+
+    table_name = f'database_table_{date_field.table_id}'
+    assert len(executed) == 2
+    assert 'CREATE INDEX CONCURRENTLY' in executed[0]
+    assert table_name in executed[0]
+    assert date_field.db_column in executed[0]
+    assert 'SET STATISTICS' in executed[1]
+
+    # If the build fails the error must not escape the post commit hook and the
+    # invalid index that a failed concurrent build leaves behind must be dropped so
+    # that a later attempt can rebuild it.
+    with patch(
+        'baserow.contrib.database.views.handler.connections'
+    ) as connections_mock:
+        cursor = connections_mock.__getitem__().cursor().__enter__()
+        cursor.execute.side_effect = [DatabaseError('canceled'), None]
+        on_commit_mock.call_args[0][0]()
+        executed = [args[0] for args, kwargs in cursor.execute.call_args_list]
+
+    assert len(executed) == 2
+    assert 'CREATE INDEX CONCURRENTLY' in executed[0]
+    assert executed[1].startswith('DROP INDEX CONCURRENTLY IF EXISTS')
+
+
+@pytest.mark.django_db
+@patch('baserow.contrib.database.views.signals.view_filter_updated.send')
+@patch.object(ViewHandler, 'create_filter_index')
+def test_update_filter_index_creation(create_filter_index_mock, send_mock,
+                                      data_fixture):
+    user = data_fixture.create_user()
+    grid_view = data_fixture.create_grid_view(user=user)
+    date_field = data_fixture.create_date_field(table=grid_view.table)
+    date_field_2 = data_fixture.create_date_field(table=grid_view.table)
+    date_filter = data_fixture.create_view_filter(
+        view=grid_view,
+        field=date_field,
+        type='date_equal',
+        value='2021-01-01'
+    )
+
+    handler = ViewHandler()
+
+    # Changing only the value of the filter must not schedule any index creation.
+    handler.update_filter(user=user, view_filter=date_filter, value='2021-02-01')
+    create_filter_index_mock.assert_not_called()
+
+    # Targeting another field can need a new index on that field's column.
+    handler.update_filter(user=user, view_filter=date_filter, field=date_field_2)
+    create_filter_index_mock.assert_called_once()
+
+
 @pytest.mark.django_db
 @patch('baserow.contrib.database.views.signals.view_filter_updated.send')
 def test_update_filter(send_mock, data_fixture):